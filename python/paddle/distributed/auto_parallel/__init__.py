@@ -12,15 +12,72 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .interface import shard_tensor  # noqa: F401
-from .interface import shard_op  # noqa: F401
-from .interface import set_shard_mask  # noqa: F401
-from .interface import set_offload_device  # noqa: F401
-from .interface import set_pipeline_stage  # noqa: F401
-from .interface import ProcessMesh  # noqa: F401
-from .completion import complete_annotation  # noqa: F401
-from .completion import complete_backward_annotation  # noqa: F401
-from .reshard import reshard  # noqa: F401
-from .cost_model import estimate_cost
-
-__all__ = []
+import sys
+import importlib
+
+# public symbol -> submodule that defines it, resolved on first access
+_LAZY = {
+    "shard_tensor": ".interface",
+    "shard_op": ".interface",
+    "set_shard_mask": ".interface",
+    "set_offload_device": ".interface",
+    "set_pipeline_stage": ".interface",
+    "ProcessMesh": ".interface",
+    "complete_annotation": ".completion",
+    "complete_backward_annotation": ".completion",
+    "reshard": ".reshard",
+    "estimate_cost": ".cost_model",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError("module {!r} has no attribute {!r}".format(
+            __name__, name))
+    submodule = _LAZY[name]
+    module = importlib.import_module(submodule, __name__)
+    # bind every name of the submodule at once, importing it also binds the
+    # submodule itself on this package, which shadows a same-named symbol
+    for lazy_name, lazy_submodule in _LAZY.items():
+        if lazy_submodule == submodule:
+            globals()[lazy_name] = getattr(module, lazy_name)
+    return globals()[name]
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+# a symbol named after its own submodule (reshard) is bound eagerly, a direct
+# import of that submodule would otherwise leave the module in its place
+for _name, _submodule in _LAZY.items():
+    if _submodule == "." + _name:
+        __getattr__(_name)
+del _name, _submodule
+
+# module level __getattr__ (PEP 562) needs python 3.7+, names already
+# bound by a previous execution of this module (e.g. reload) are kept
+if sys.version_info < (3, 7):
+
+    def estimate_cost(*args, **kwargs):
+        # keep the cost model out of the eager imports, the real function
+        # replaces this forwarder in the module globals on first call
+        return __getattr__("estimate_cost")(*args, **kwargs)
+
+    for _name in _LAZY:
+        if _name not in globals():
+            __getattr__(_name)
+    del _name
+
+__all__ = [
+    'shard_tensor',
+    'shard_op',
+    'set_shard_mask',
+    'set_offload_device',
+    'set_pipeline_stage',
+    'ProcessMesh',
+    'complete_annotation',
+    'complete_backward_annotation',
+    'reshard',
+    'estimate_cost',
+]
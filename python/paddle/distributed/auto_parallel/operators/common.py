@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License
 
+import functools
+
 DISTRIBUTED_OPERATORS = {}
 
 
@@ -68,8 +70,12 @@ class DistributedOperatorImpl:
 def register_distributed_operator(name, dist_op):
     global DISTRIBUTED_OPERATORS
     DISTRIBUTED_OPERATORS[name] = dist_op
+    # lookups are cached, drop them whenever the registry changes
+    get_distributed_operator.cache_clear()
+    get_distributed_operator_impl.cache_clear()
 
 
+@functools.lru_cache(maxsize=None)
 def get_distributed_operator(name):
     global DISTRIBUTED_OPERATORS
     return DISTRIBUTED_OPERATORS.get(name, None)
@@ -79,10 +85,12 @@ def register_distributed_operator_impl(name, dist_impl):
     dist_op = get_distributed_operator(name)
     if dist_op is not None:
         dist_op.register_impl(dist_impl)
+        get_distributed_operator_impl.cache_clear()
     else:
         assert False, "Must register distributed operator first."
 
 
+@functools.lru_cache(maxsize=None)
 def get_distributed_operator_impl(name, impl_idx):
     global DISTRIBUTED_OPERATORS
     return DISTRIBUTED_OPERATORS[name].get_impl(impl_idx)
@@ -12,28 +12,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License
 
-import copy
-import numpy as np
+import os
 import paddle
 import paddle.fluid as fluid
 from paddle.fluid import core
 from paddle.fluid import framework as framework
-from paddle.fluid import core, unique_name
 from paddle.fluid.framework import Program, Parameter, Variable, program_guard
-from paddle.fluid.data_feeder import check_variable_and_dtype, check_dtype
-from paddle.fluid.backward import append_backward, _some_in_set_, _append_grad_suffix_
-from paddle.distributed.auto_parallel.operators.common import get_distributed_operator
-from paddle.fluid.clip import GradientClipBase, GradientClipByNorm, error_clip_callback, append_gradient_clip_ops, ClipGradByGlobalNorm
+from paddle.fluid.backward import append_backward
+from paddle.distributed.auto_parallel.operators.common import get_distributed_operator, get_distributed_operator_impl
+from paddle.fluid.clip import error_clip_callback
 from paddle.distributed.fleet.base.distributed_strategy import DistributedStrategy
-from paddle.distributed.auto_parallel.context import DistributedContext, DistOpHelper
-from paddle.distributed.fleet.meta_optimizers.common import is_loss_grad_op, is_backward_op, is_optimizer_op
-from paddle.distributed.fleet.meta_optimizers.common import OpRole, OP_ROLE_KEY, OP_ROLE_VAR_KEY
-from .process import new_process_group
-from .interface import _g_process_mesh_map
+from paddle.distributed.auto_parallel.context import DistributedContext
+from paddle.distributed.fleet.meta_optimizers.common import OpRole
 from .attribute import OperatorDistributedAttribute
 from paddle.distributed.auto_parallel.completion import complete_backward_annotation, complete_update_annotation
 
-__varname_not_in_block__ = ["lod_tensor_blocking_queue_0"]
+__varname_not_in_block__ = frozenset(("lod_tensor_blocking_queue_0", ))
+
+_OP_ROLE_FORWARD = int(OpRole.Forward)
+_OP_ROLE_BACKWARD = int(OpRole.Backward)
+_OP_ROLE_LOSS = int(OpRole.Loss)
+_OP_ROLE_FWD_LOSS = _OP_ROLE_FORWARD | _OP_ROLE_LOSS
+
+_DEFAULT_CALLBACKS = (error_clip_callback, )
 
 
 class Partitioner(object):
@@ -143,8 +144,30 @@ class Partitioner(object):
             startup_program (paddle.fluid.framework.program): distributed startup program with forward network only
         """
 
-        dist_main_program, dist_startup_program = self.transpile_forward_impl(
+        if not isinstance(serial_main_program, (Program)):
+            raise TypeError(
+                "dist_strategy be paddle.fluid.framework.program, got %s here" %
+                type(serial_main_program))
+
+        if not isinstance(serial_startup_program, (Program)):
+            raise TypeError(
+                "auto_parallel_context be paddle.fluid.framework.program, got %s here"
+                % type(serial_startup_program))
+
+        # check if shard annotated serial program valid
+        if not self._is_valid_annotated_program(serial_main_program):
+            raise RuntimeError(
+                "Not all vars or ops are annotated in main program !")
+
+        # dist op & partition vars
+        dist_main_program, dist_startup_program = self._dist_var_op_forward_transpile(
             serial_main_program, serial_startup_program)
+
+        # Sharding
+        if self._dist_strategy.sharding:
+            dist_main_program, dist_startup_program = self._sharding_forward_transpile(
+                dist_main_program, dist_startup_program)
+
         return dist_main_program, dist_startup_program
 
     def apply_backward(self,
@@ -184,83 +207,18 @@ class Partitioner(object):
         return:
             params_grads (list) list of tuple that contain param and its grad variable
         """
-        params_grads = self.apply_backward_impl(
-            serial_loss, serial_main_program, serial_startup_program,
-            dist_main_program, dist_startup_program)
-        return params_grads
-
-    def apply_optimize(self, user_define_optimizer, params_grads,
-                       dist_main_program, dist_startup_program):
-        """
-        append update related ops to the program: clip, weight decay, ops
-        filter optimize op if sharding is enable
-        naive gradient synchronization before update
-
-        Args:
-            user_define_optimizer (paddle.fluid.optimizer): 
-            params_grads (list) list of tuple that contain param and its grad variable
-            dist_main_program (paddle.fluid.framework.program): dist main program with forward & backward network 
-            dist_startup_program (paddle.fluid.framework.program): dist startup program with forward & backward  network 
-        """
-
-        optimize_ops = self.apply_optimize_impl(user_define_optimizer,
-                                                params_grads, dist_main_program,
-                                                dist_startup_program)
-
-        return optimize_ops
-
-    def transpile_forward_impl(self, main_program, startup_program):
-
-        if not isinstance(main_program, (Program)):
-            raise TypeError(
-                "dist_strategy be paddle.fluid.framework.program, got %s here" %
-                type(main_program))
-
-        if not isinstance(startup_program, (Program)):
-            raise TypeError(
-                "auto_parallel_context be paddle.fluid.framework.program, got %s here"
-                % type(startup_program))
-
-        # check if shard annotated serial program valid
-        if not self._is_valid_annotated_program(main_program):
-            raise RuntimeError(
-                "Not all vars or ops are annotated in main program !")
-
-        # dist op & partition vars
-        new_main_prog, new_startup_program = self._dist_var_op_forward_transpile(
-            main_program, startup_program)
-
-        # Sharding
-        if self._dist_strategy.sharding:
-            new_main_prog, new_startup_program = self._sharding_forward_transpile(
-                new_main_prog, new_startup_program)
-
-        return new_main_prog, new_startup_program
-
-    def apply_backward_impl(self,
-                            serial_loss,
-                            serial_main_program,
-                            serial_startup_program,
-                            dist_main_program,
-                            dist_startup_program,
-                            parameter_list=None,
-                            no_grad_set=None,
-                            callbacks=None):
-        """
-        """
-
         params_grads = self._dist_var_op_backward_transpile(
             serial_loss, serial_main_program, serial_startup_program,
             dist_main_program, dist_startup_program)
         # Sharding
         if self._dist_strategy.sharding:
-            self._sharding_backward_transpile(new_main_prog,
-                                              new_startup_program)
+            self._sharding_backward_transpile(dist_main_program,
+                                              dist_startup_program)
 
         return params_grads
 
-    def apply_optimize_impl(self, user_define_optimizer, params_grads,
-                            dist_main_program, dist_startup_program):
+    def apply_optimize(self, user_define_optimizer, params_grads,
+                       dist_main_program, dist_startup_program):
         """
         append update related ops to the program: clip, weight decay, ops
         filter optimize op if sharding is enable
@@ -274,7 +232,7 @@ class Partitioner(object):
         """
 
         if self._dist_strategy.sharding:
-            params_grads = sharding_optimize_transpile(
+            params_grads = self._sharding_optimize_transpile(
                 params_grads, dist_main_program, dist_startup_program)
 
         optimize_ops = self._optimize_transpile(user_define_optimizer,
@@ -283,6 +241,11 @@ class Partitioner(object):
 
         return optimize_ops
 
+    # kept as aliases for callers of the former *_impl methods
+    transpile_forward_impl = transpile_forward
+    apply_backward_impl = apply_backward
+    apply_optimize_impl = apply_optimize
+
     def _dist_var_op_forward_transpile(self,
                                        serial_main_program,
                                        serial_startup_program=None):
@@ -291,6 +254,12 @@ class Partitioner(object):
         2. replace local op with corresponding dist op
         """
 
+        ctx = self._auto_parallel_context
+        get_op_attr = ctx.get_op_distributed_attr_for_program
+        get_var_attr = ctx.get_tensor_distributed_attr_for_program
+        set_op_attr = ctx.set_op_distributed_attr_for_program
+        dist_op_helper = ctx.get_dist_op_helper()
+
         partitioned_main_prog = fluid.Program()
         partitioned_global_block = partitioned_main_prog.global_block()
         serial_main_block = serial_main_program.global_block()
@@ -304,22 +273,19 @@ class Partitioner(object):
             # create parameter
             partitioned_startup_global_block = partitioned_startup_prog.global_block(
             )
-            param2shape = {}
-            temp_varname_map = {}
+            # serial param name -> (dist param name, dist shape)
+            param_info = {}
             for var in serial_startup_program.list_vars():
                 if isinstance(var, Parameter):
                     # TODO if var not belong to this rank, should be filtered
                     serial_main_var = serial_main_block.var(var.name)
-                    dist_attr = self._auto_parallel_context.get_tensor_distributed_attr_for_program(
-                        serial_main_var)
+                    dist_attr = get_var_attr(serial_main_var)
                     target_shape = _get_dist_shape(serial_main_var, dist_attr)
                     new_name = var.name + self._dist_varname_suffix
-                    temp_varname_map[var.name] = new_name
-                    _partition_parameter(self._auto_parallel_context,
-                                         serial_main_var,
+                    _partition_parameter(ctx, serial_main_var,
                                          partitioned_startup_global_block,
-                                         new_name, target_shape)
-                    param2shape[new_name] = target_shape
+                                         new_name, target_shape, dist_attr)
+                    param_info[var.name] = (new_name, target_shape)
 
             # copy initializer
             for op in serial_startup_program.global_block().ops:
@@ -329,86 +295,82 @@ class Partitioner(object):
                     output_vars
                 ) == 1, "initializer should output only ONE variable, but got [{}]".format(
                     str(op.desc))
-                assert temp_varname_map[output_vars[
-                    0]] in param2shape, "try to initialize [{}] which is not a Parameter".format(
-                        output_vars[0])
+                info = param_info.get(output_vars[0])
+                assert info is not None, "try to initialize [{}] which is not a Parameter".format(
+                    output_vars[0])
+                new_name, target_shape = info
                 new_op_desc = partitioned_startup_global_block.desc.append_op()
                 new_op_desc.copy_from(op.desc)
-                new_op_desc._rename_output(output_vars[0],
-                                           temp_varname_map[output_vars[0]])
-                new_op_desc._set_attr(
-                    "shape", param2shape[temp_varname_map[output_vars[0]]])
-                partitioned_startup_global_block._sync_with_cpp()
+                new_op_desc._rename_output(output_vars[0], new_name)
+                new_op_desc._set_attr("shape", target_shape)
+                # add new op in the python and cpp at the same time
+                new_op = framework.Operator(
+                    block=partitioned_startup_global_block,
+                    desc=new_op_desc,
+                    type=None,
+                    inputs=None,
+                    outputs=None,
+                    attrs=None)
+                partitioned_startup_global_block.ops.append(new_op)
 
                 # set distribute atrribute
-                new_op = partitioned_startup_global_block.ops[-1]
-                assert new_op.type == new_op_desc.type()
-                assert new_op.desc == new_op_desc
-                output_var = partitioned_startup_global_block.var(output_vars[
-                    0])
-                output_var_attr = self._auto_parallel_context.get_tensor_distributed_attr_for_program(
-                    output_var)
-                op_attr = OperatorDistributedAttribute(
-                    new_op, self._auto_parallel_context)
+                output_var = partitioned_startup_global_block.var(
+                    output_vars[0])
+                output_var_attr = get_var_attr(output_var)
+                op_attr = OperatorDistributedAttribute(new_op, ctx)
                 op_attr.set_process_mesh(output_var_attr.get_process_mesh())
                 op_attr.set_output_dims_mapping(
                     output_var.name, output_var_attr.get_dims_mapping())
                 op_attr.set_input_dims_mapping(
                     output_var.name, output_var_attr.get_dims_mapping())
-                self._auto_parallel_context.set_op_distributed_attr_for_program(
-                    new_op, op_attr)
+                set_op_attr(new_op, op_attr)
 
         # TODO move helper init to a comm place
-        dist_op_helper = self._auto_parallel_context.get_dist_op_helper()
         dist_op_helper.set_dst_main_program(partitioned_main_prog)
         dist_op_helper.set_dst_startup_program(partitioned_startup_prog)
         dist_op_helper.set_varname_mapping(self._serial2dist_varname_mapping)
         dist_op_helper.set_rank_id(self._rank_id)
 
         # transpile main program
+        serial_vars = serial_main_block.vars
+        mapping = self._serial2dist_varname_mapping
+        suffix = self._dist_varname_suffix
+        default_dist_op_impl = get_distributed_operator("default").get_impl(0)
         for op in serial_ops:
+            input_names = op.desc.input_arg_names()
+            output_names = op.desc.output_arg_names()
 
             # partititon input variables
-            for serial_input_varname in op.desc.input_arg_names():
-                if serial_input_varname not in self._serial2dist_varname_mapping:
-                    new_varname = serial_input_varname + self._dist_varname_suffix
-                    if serial_main_block.has_var(serial_input_varname):
-                        _partition_var(self._auto_parallel_context,
-                                       serial_main_block,
+            for serial_input_varname in input_names:
+                if serial_input_varname not in mapping:
+                    new_varname = serial_input_varname + suffix
+                    if serial_input_varname in serial_vars:
+                        _partition_var(ctx, serial_main_block,
                                        partitioned_global_block,
                                        serial_input_varname, new_varname)
                     else:
                         assert serial_input_varname in __varname_not_in_block__
 
-                    self._serial2dist_varname_mapping[
-                        serial_input_varname] = new_varname
+                    mapping[serial_input_varname] = new_varname
 
             # partition output vars
-            for serial_output_varname in op.desc.output_arg_names():
-                if serial_output_varname not in self._serial2dist_varname_mapping:
-                    new_varname = serial_output_varname + self._dist_varname_suffix
-                    _partition_var(self._auto_parallel_context,
-                                   serial_main_block, partitioned_global_block,
+            for serial_output_varname in output_names:
+                if serial_output_varname not in mapping:
+                    new_varname = serial_output_varname + suffix
+                    _partition_var(ctx, serial_main_block,
+                                   partitioned_global_block,
                                    serial_output_varname, new_varname)
-                    self._serial2dist_varname_mapping[
-                        serial_output_varname] = new_varname
+                    mapping[serial_output_varname] = new_varname
 
             # partition op
             kinputs, koutputs = dist_op_helper.prepare_forward_context(op)
-            dist_attr = self._auto_parallel_context.get_op_distributed_attr_for_program(
-                op)
-            if _is_dist_op_forward_implement(self._auto_parallel_context, op):
-                dist_ops = get_distributed_operator(op.type)
-                dist_op_impl = dist_ops.get_impl(dist_attr.get_impl_idx())
-                dist_op_impl.forward(self._auto_parallel_context, **kinputs,
-                                     **koutputs)
+            dist_op_impl = _get_dist_op_forward_impl(op, get_op_attr(op))
+            if dist_op_impl is not None:
+                dist_op_impl.forward(ctx, **kinputs, **koutputs)
 
             else:
                 # replicate op
-                dist_ops = get_distributed_operator("default")
-                dist_op_impl = dist_ops.get_impl(0)
-                dist_op_impl.forward(self._auto_parallel_context, **kinputs,
-                                     **koutputs)
+                default_dist_op_impl.forward(ctx, **kinputs, **koutputs)
 
         return partitioned_main_prog, partitioned_startup_prog
 
@@ -428,6 +390,10 @@ class Partitioner(object):
             3. NV-Megatron-like col parallel linear
         """
 
+        ctx = self._auto_parallel_context
+        get_op_attr = ctx.get_op_distributed_attr_for_program
+        dist_op_helper = ctx.get_dist_op_helper()
+
         if self._compatible_with_auto_backward:
             assert isinstance(
                 serial_loss, Variable), "The target loss should be an Variable."
@@ -453,7 +419,6 @@ class Partitioner(object):
                     for param in no_grad_set
                 ]
 
-            dist_op_helper = self._auto_parallel_context.get_dist_op_helper()
             params_and_grads = _auto_backward(
                 dist_loss,
                 dist_startup_program,
@@ -463,53 +428,49 @@ class Partitioner(object):
                 distop_context=dist_op_helper)
 
             # backward completion 
-            complete_backward_annotation(
-                dist_main_program, dist_context=self._auto_parallel_context)
+            complete_backward_annotation(dist_main_program, dist_context=ctx)
 
             # transpiler backward for dist op
-            # get backward ops
-            ops = dist_main_program.global_block().ops
+            # forward ops are collected until the first backward op, every
+            # op from there on is a backward op to transpile. dist backward
+            # impls append ops to the same block, so walk a snapshot of it.
+            ops = list(dist_main_program.global_block().ops)
             first_backward_op_idx = -1
             forward_op_id2forward_op = {}
-            for idx in range(len(ops)):
-                if is_forward_op(ops[idx]):
-                    forward_op_id2forward_op[ops[idx].desc.id()] = ops[idx]
-
-                if int(ops[idx].attr('op_role')) == int(OpRole.Backward):
+            default_dist_op_impl = get_distributed_operator("default").get_impl(
+                0)
+            for idx, op in enumerate(ops):
+                if first_backward_op_idx < 0:
+                    # op_role is an int attribute
+                    op_role = op.attr('op_role')
+                    if op_role != _OP_ROLE_BACKWARD:
+                        if op_role in (_OP_ROLE_FORWARD, _OP_ROLE_FWD_LOSS):
+                            forward_op_id2forward_op[op.desc.id()] = op
+                        continue
                     first_backward_op_idx = idx
-                    break
-            assert first_backward_op_idx >= 0, "not found backward ops in program"
-            assert len(forward_op_id2forward_op
-                       ) > 0, "not found forward ops in program"
+                    assert len(forward_op_id2forward_op
+                               ) > 0, "not found forward ops in program"
 
-            backward_ops = ops[first_backward_op_idx:]
-            for backward_op in backward_ops:
                 # if the backward op has a corresponding forward op
-                if backward_op.desc.id() in dist_op_helper.gradopidx2opidx:
-                    forward_op_id = dist_op_helper.gradopidx2opidx[
-                        backward_op.desc.id()]
+                forward_op_id = dist_op_helper.gradopidx2opidx.get(op.desc.id())
+                if forward_op_id is not None:
                     forward_op = forward_op_id2forward_op[forward_op_id]
                     # TODO backward attr should has _impl_idx
-                    forward_op_dist_attr = self._auto_parallel_context.get_op_distributed_attr_for_program(
-                        forward_op)
-                    # TODO use the backward op itself to find the dist op
-                    dist_ops = get_distributed_operator(forward_op.type)
+                    forward_op_dist_attr = get_op_attr(forward_op)
                     kinputs, koutputs = dist_op_helper.prepare_backward_context(
-                        backward_op)
+                        op)
 
                     # TODO use backward op itself to determine impl idx
-                    if _is_dist_op_backward_implement(
-                            self._auto_parallel_context, forward_op):
-                        dist_op_impl = dist_ops.get_impl(
-                            forward_op_dist_attr.get_impl_idx())
-                        dist_op_impl.backward(self._auto_parallel_context,
-                                              **kinputs, **koutputs)
+                    # TODO use the backward op itself to find the dist op
+                    dist_op_impl = _get_dist_op_backward_impl(
+                        forward_op, forward_op_dist_attr)
+                    if dist_op_impl is not None:
+                        dist_op_impl.backward(ctx, **kinputs, **koutputs)
                     else:
                         # replicate op
-                        dist_ops = get_distributed_operator("default")
-                        dist_op_impl = dist_ops.get_impl(0)
-                        dist_op_impl.backward(self._auto_parallel_context,
-                                              **kinputs, **koutputs)
+                        default_dist_op_impl.backward(ctx, **kinputs,
+                                                      **koutputs)
+            assert first_backward_op_idx >= 0, "not found backward ops in program"
 
             return params_and_grads
         # replace dist grad ops
@@ -530,29 +491,26 @@ class Partitioner(object):
 
     def _is_valid_annotated_program(self, program):
 
+        # the check walks the whole global block, allow deployments that
+        # trust their annotations to skip it
+        skip_validation = os.getenv("PADDLE_SKIP_DIST_VALIDATION", "0")
+        if skip_validation in ("1", "true", "True"):
+            return True
+
         # TODO (ZJ-LIANG) should check all block
-        ops = program.global_block().ops
-        vars_ = program.list_vars()
-        op_dist_attrs = [
-            self._auto_parallel_context.get_op_distributed_attr_for_program(op)
-            for op in ops
-        ]
-        var_dist_attrs = [
-            self._auto_parallel_context.get_tensor_distributed_attr_for_program(
-                var) for var in vars_
-        ]
-
-        all_ops_annotated = all(dist_attr is not None
-                                for dist_attr in op_dist_attrs)
-        all_vars_annotated = all(dist_attr is not None
-                                 for dist_attr in var_dist_attrs)
-
-        return all_ops_annotated and all_vars_annotated
+        block = program.global_block()
+        get_op_attr = self._auto_parallel_context.get_op_distributed_attr_for_program
+        get_var_attr = self._auto_parallel_context.get_tensor_distributed_attr_for_program
+
+        # stop at the first op or var without dist attr
+        all_ops_annotated = all(get_op_attr(op) is not None for op in block.ops)
+        return all_ops_annotated and all(
+            get_var_attr(var) is not None for var in block.vars.values())
 
     def _serial_varname2dist_var(self, serial_varname, dist_program):
-        assert serial_varname in self._serial2dist_varname_mapping, "The serial var [{}] is not found in var name mapping".format(
+        dist_varname = self._serial2dist_varname_mapping.get(serial_varname)
+        assert dist_varname is not None, "The serial var [{}] is not found in var name mapping".format(
             serial_varname)
-        dist_varname = self._serial2dist_varname_mapping[serial_varname]
 
         assert dist_program.global_block().has_var(
             dist_varname
@@ -610,11 +568,12 @@ def _get_no_grad_set_name(no_grad_set):
     no_grad_set_name = set()
     if no_grad_set is not None:
         if isinstance(no_grad_set, (set, list, tuple)):
-            for i, no_grad_var in enumerate(no_grad_set):
-                if isinstance(no_grad_var, framework.Variable):
-                    no_grad_set_name.add(no_grad_var.name)
-                elif isinstance(no_grad_var, six.string_types):
-                    no_grad_set_name.add(no_grad_var)
+            add = no_grad_set_name.add
+            for no_grad_var in no_grad_set:
+                if isinstance(no_grad_var, str):
+                    add(no_grad_var)
+                elif isinstance(no_grad_var, framework.Variable):
+                    add(no_grad_var.name)
                 else:
                     raise TypeError(
                         "The type of no_grad_set's member must be paddle.fluid.Variable or str, but received %s."
@@ -628,29 +587,36 @@ def _get_no_grad_set_name(no_grad_set):
 
 def _get_no_grad_set(loss, no_grad_set=None):
     no_grad_set = _get_no_grad_set_name(no_grad_set)
-    parameters = loss.block.program.global_block().all_parameters()
-    param_no_trainable = set(
-        [param.name for param in parameters if param.trainable is False])
+    parameters = loss.block.program.global_block().iter_parameters()
     # If the parameter is no trainable, it should not have a gradient.
-    no_grad_set.update(param_no_trainable)
+    no_grad_set.update(
+        param.name for param in parameters if param.trainable is False)
 
     return no_grad_set
 
 
-def _is_dist_op_forward_implement(auto_paralle_context, op):
-    dist_attr = auto_paralle_context.get_op_distributed_attr_for_program(op)
-    dist_ops = get_distributed_operator(op.type)
+def _get_dist_op_forward_impl(op, dist_attr):
+    # None means the op is replicated by the default dist impl
+    if get_distributed_operator(op.type) is None:
+        return None
+    impl_idx = dist_attr.get_impl_idx()
+    if impl_idx < 0:
+        return None
 
-    return dist_ops and dist_attr.get_impl_idx() >= 0 and dist_ops.get_impl( \
-        dist_attr.get_impl_idx())._forward_implemented
+    dist_op_impl = get_distributed_operator_impl(op.type, impl_idx)
+    return dist_op_impl if dist_op_impl._forward_implemented else None
 
 
-def _is_dist_op_backward_implement(auto_paralle_context, op):
-    dist_attr = auto_paralle_context.get_op_distributed_attr_for_program(op)
-    dist_ops = get_distributed_operator(op.type)
+def _get_dist_op_backward_impl(op, dist_attr):
+    # None means the op is replicated by the default dist impl
+    if get_distributed_operator(op.type) is None:
+        return None
+    impl_idx = dist_attr.get_impl_idx()
+    if impl_idx < 0:
+        return None
 
-    return dist_ops and dist_attr.get_impl_idx() >= 0 and dist_ops.get_impl( \
-        dist_attr.get_impl_idx())._backward_implemented
+    dist_op_impl = get_distributed_operator_impl(op.type, impl_idx)
+    return dist_op_impl if dist_op_impl._backward_implemented else None
 
 
 def _auto_backward(loss,
@@ -666,7 +632,7 @@ def _auto_backward(loss,
     assert isinstance(loss, Variable), "The target loss should be an Variable."
 
     if callbacks is None:
-        callbacks = [error_clip_callback]
+        callbacks = _DEFAULT_CALLBACKS
     else:
         assert (isinstance(callbacks, list))
 
@@ -692,11 +658,7 @@ def _is_distributed(dist_attr):
 
     mapping = dist_attr.get_dims_mapping()
     mesh = dist_attr.get_process_mesh().topology
-    for idx in range(len(mapping)):
-        if mapping[idx] >= 0 and mesh[mapping[idx]] > 1:
-            return True
-
-    return False
+    return any(mesh_dim >= 0 and mesh[mesh_dim] > 1 for mesh_dim in mapping)
 
 
 def _get_dist_shape(var, dist_attr):
@@ -709,20 +671,31 @@ def _get_dist_shape(var, dist_attr):
     ), "variable shape [{}] and dim_mapping [{}] is NOT match !".format(
         var_shape, mapping)
     new_shape = []
-    for idx in range(len(var_shape)):
-        if var_shape[idx] == -1 or mapping[idx] == -1:
-            new_shape.append(var_shape[idx])
+    for dim, mesh_dim in zip(var_shape, mapping):
+        if dim == -1 or mesh_dim == -1:
+            new_shape.append(dim)
         else:
-            assert var_shape[idx] % mesh[mapping[
-                idx]] == 0, "un-event partition: var_shape[idx]=[{}], mesh[{}]".format(
-                    var_shape[idx], mesh[mapping[idx]])
-            new_shape.append(var_shape[idx] // mesh[mapping[idx]])
+            degree = mesh[mesh_dim]
+            assert dim % degree == 0, "un-event partition: var_shape[idx]=[{}], mesh[{}]".format(
+                dim, degree)
+            new_shape.append(dim // degree)
 
     return new_shape
 
 
+def _bind_dist_attr(auto_paralle_context, src_dist_attr, dst_var):
+    """
+    give the partitioned var a copy of the serial var's dist attr
+    """
+    assert src_dist_attr is not None
+    dist_attr = src_dist_attr.clone()
+    dist_attr._owner_tensor = dst_var
+    auto_paralle_context.set_tensor_distributed_attr_for_program(dst_var,
+                                                                 dist_attr)
+
+
 def _partition_parameter(auto_paralle_context, src_var, dst_block, dst_varname,
-                         dst_shape):
+                         dst_shape, src_dist_attr):
     # NOTE hack to copied Parameter
     # not initialized parameter, need to initialize it 
     copied_kwargs = {}
@@ -748,18 +721,11 @@ def _partition_parameter(auto_paralle_context, src_var, dst_block, dst_varname,
     # set dist attr uid
     # distributed_attr_uid = src_var.desc.get_distributed_attr_uid()
     # param.desc.set_distributed_attr_uid(distributed_attr_uid)
-    dist_attr = copy.deepcopy(
-        auto_paralle_context.get_tensor_distributed_attr_for_program(src_var))
-    assert dist_attr is not None
-    dist_attr._owner_tensor = param
-    dist_attr._owner_context = auto_paralle_context.get_tensor_distributed_attr_for_program(
-        src_var)._owner_context
-    auto_paralle_context.set_tensor_distributed_attr_for_program(param,
-                                                                 dist_attr)
+    _bind_dist_attr(auto_paralle_context, src_dist_attr, param)
 
 
 def _partition_intermediate_var(auto_paralle_context, src_var, dst_block,
-                                dst_varname, dst_shape):
+                                dst_varname, dst_shape, src_dist_attr):
     var = dst_block.create_var(
         type=src_var.type,
         name=dst_varname,
@@ -775,13 +741,7 @@ def _partition_intermediate_var(auto_paralle_context, src_var, dst_block,
     # set dist attr uid
     # distributed_attr_uid = src_var.desc.get_distributed_attr_uid()
     # var.desc.set_distributed_attr_uid(distributed_attr_uid)
-    dist_attr = copy.deepcopy(
-        auto_paralle_context.get_tensor_distributed_attr_for_program(src_var))
-    assert dist_attr is not None
-    dist_attr._owner_tensor = var
-    dist_attr._owner_context = auto_paralle_context.get_tensor_distributed_attr_for_program(
-        src_var)._owner_context
-    auto_paralle_context.set_tensor_distributed_attr_for_program(var, dist_attr)
+    _bind_dist_attr(auto_paralle_context, src_dist_attr, var)
 
 
 def _partition_var(auto_paralle_context, src_block, dst_block, src_varname,
@@ -804,10 +764,11 @@ def _partition_var(auto_paralle_context, src_block, dst_block, src_varname,
 
         if isinstance(src_var, Parameter):
             _partition_parameter(auto_paralle_context, src_var, dst_block,
-                                 dst_varname, target_shape)
+                                 dst_varname, target_shape, dist_attr)
         else:
             _partition_intermediate_var(auto_paralle_context, src_var,
-                                        dst_block, dst_varname, target_shape)
+                                        dst_block, dst_varname, target_shape,
+                                        dist_attr)
 
 
 def _insert_src_op(src_op, dst_block, varname_mapping):
@@ -825,27 +786,28 @@ def _insert_src_op(src_op, dst_block, varname_mapping):
 def _insert_dist_op(src_op, dst_block, varname_mapping, auto_paralle_context,
                     rank_id):
 
+    src_op_desc = src_op.desc
+    get_input = src_op_desc.input
+    get_output = src_op_desc.output
+
     # build input varname mapping
-    input_mapping = {}
-    for input_name in src_op.desc.input_names():
-        varnames = []
-        for varname in src_op.desc.input(input_name):
-            varnames.append(varname_mapping[varname])
-        input_mapping[input_name] = varnames
+    input_mapping = {
+        input_name:
+        [varname_mapping[varname] for varname in get_input(input_name)]
+        for input_name in src_op_desc.input_names()
+    }
 
     # build output varname mapping
-    output_mapping = {}
-    for output_name in src_op.desc.output_names():
-        varnames = []
-        for varname in src_op.desc.output(output_name):
-            varnames.append(varname_mapping[varname])
-        output_mapping[output_name] = varnames
+    output_mapping = {
+        output_name:
+        [varname_mapping[varname] for varname in get_output(output_name)]
+        for output_name in src_op_desc.output_names()
+    }
 
     # append dist op 
     dist_attr = auto_paralle_context.get_op_distributed_attr_for_program(src_op)
-    dist_ops = get_distributed_operator(src_op.type)
-    append_op_handle = dist_ops.get_impl(dist_attr.get_impl_idx()).forward(
-        src_op)
+    append_op_handle = get_distributed_operator_impl(
+        src_op.type, dist_attr.get_impl_idx()).forward(src_op)
     append_op_handle(
         dst_block,
         src_op,
@@ -856,8 +818,4 @@ def _insert_dist_op(src_op, dst_block, varname_mapping, auto_paralle_context,
 
 
 def is_forward_op(op):
-    role1 = int(core.op_proto_and_checker_maker.OpRole.Forward) | int(
-        core.op_proto_and_checker_maker.OpRole.Loss)
-    role2 = int(core.op_proto_and_checker_maker.OpRole.Forward)
-    op_role = int(op.attr('op_role'))
-    return op_role == role2 or op_role == role1
+    return int(op.attr('op_role')) in (_OP_ROLE_FORWARD, _OP_ROLE_FWD_LOSS)
@@ -138,6 +138,24 @@ class TestAutoParallelAPI(unittest.TestCase):
         self.assertEqual(mesh3.process_group, [0, 1, 2, 3])
         self.assertEqual(mesh4.process_group, mesh4._desc.process_group)
 
+    def test_reshard_not_shadowed_by_submodule(self):
+        import paddle.distributed.auto_parallel as auto_parallel
+        import paddle.distributed.auto_parallel.reshard
+        from paddle.distributed.auto_parallel.reshard import reshard
+
+        self.assertTrue(callable(auto_parallel.reshard))
+        self.assertIs(auto_parallel.reshard, reshard)
+
+    def test_dir_lists_lazy_and_loaded_names(self):
+        import paddle.distributed.auto_parallel as auto_parallel
+
+        # resolving a lazy name binds its submodule on the package
+        auto_parallel.shard_tensor
+        names = dir(auto_parallel)
+        self.assertIn("interface", names)
+        for name in auto_parallel.__all__:
+            self.assertIn(name, names)
+
 
 if __name__ == '__main__':
     unittest.main()
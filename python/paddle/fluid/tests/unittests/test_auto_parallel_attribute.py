@@ -0,0 +1,82 @@
+# Copyright (c) 2021 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+
+import copy
+import unittest
+import paddle
+import paddle.static as static
+import paddle.distributed as dist
+from paddle.distributed.auto_parallel.context import DistributedContext
+from paddle.distributed.auto_parallel.attribute import TensorDistributedAttribute
+
+paddle.enable_static()
+
+MESH = dist.ProcessMesh([[0, 1, 2], [3, 4, 5]])
+
+
+class TestTensorDistributedAttribute(unittest.TestCase):
+    def _build_dist_attr(self):
+        main_program = static.Program()
+        with static.program_guard(main_program):
+            x = static.data(name="x", shape=[4, 6], dtype='float32')
+        dist_attr = TensorDistributedAttribute(x, DistributedContext())
+        dist_attr.set_process_mesh(MESH)
+        dist_attr.set_dims_mapping([0, -1])
+        dist_attr.set_shard_mask([[1, 0, 1], [0, 1, 0]])
+        dist_attr.set_offload_device("cpu")
+        dist_attr.set_shape([4, 6])
+        dist_attr.mark_as_annotated("process_mesh")
+        dist_attr.mark_as_annotated("dims_mapping")
+        dist_attr.mark_as_parameter()
+        return dist_attr
+
+    def test_clone_matches_deepcopy(self):
+        dist_attr = self._build_dist_attr()
+        cloned = dist_attr.clone()
+        deep_copied = copy.deepcopy(dist_attr)
+
+        self.assertEqual(sorted(cloned.__dict__), sorted(deep_copied.__dict__))
+        self.assertIs(cloned.get_owner_tensor(), deep_copied.get_owner_tensor())
+        self.assertIs(cloned.get_owner_context(),
+                      deep_copied.get_owner_context())
+        self.assertEqual(cloned.get_process_mesh(),
+                         deep_copied.get_process_mesh())
+        self.assertEqual(cloned.get_dims_mapping(),
+                         deep_copied.get_dims_mapping())
+        self.assertEqual(cloned.get_shard_mask(), deep_copied.get_shard_mask())
+        self.assertEqual(cloned.get_offload_device(),
+                         deep_copied.get_offload_device())
+        self.assertEqual(cloned.get_shape(), deep_copied.get_shape())
+        self.assertEqual(cloned._is_annotated, deep_copied._is_annotated)
+        self.assertEqual(cloned.is_parameter(), deep_copied.is_parameter())
+
+    def test_clone_copies_containers(self):
+        dist_attr = self._build_dist_attr()
+        cloned = dist_attr.clone()
+
+        cloned.get_dims_mapping()[0] = -1
+        cloned.get_shape()[0] = 2
+        cloned.get_shard_mask()[0][0] = 0
+        cloned.mark_as_annotated("shard_mask")
+        self.assertEqual(dist_attr.get_dims_mapping(), [0, -1])
+        self.assertEqual(dist_attr.get_shape(), [4, 6])
+        self.assertEqual(dist_attr.get_shard_mask(), [[1, 0, 1], [0, 1, 0]])
+        self.assertFalse(dist_attr.is_annotated("shard_mask"))
+        self.assertIs(cloned.get_process_mesh(), dist_attr.get_process_mesh())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+# Copyright (c) 2021 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+
+import unittest
+from paddle.distributed.auto_parallel.operators import common
+from paddle.distributed.auto_parallel.operators.common import DistributedOperator
+from paddle.distributed.auto_parallel.operators.common import DistributedOperatorImpl
+from paddle.distributed.auto_parallel.operators.common import register_distributed_operator
+from paddle.distributed.auto_parallel.operators.common import register_distributed_operator_impl
+from paddle.distributed.auto_parallel.operators.common import get_distributed_operator
+from paddle.distributed.auto_parallel.operators.common import get_distributed_operator_impl
+
+OP_TYPE = "auto_parallel_registry_test_op"
+
+
+class TestDistributedOperatorRegistry(unittest.TestCase):
+    def tearDown(self):
+        common.DISTRIBUTED_OPERATORS.pop(OP_TYPE, None)
+        get_distributed_operator.cache_clear()
+        get_distributed_operator_impl.cache_clear()
+
+    def test_register_after_lookup(self):
+        self.assertIsNone(get_distributed_operator(OP_TYPE))
+
+        dist_op = DistributedOperator()
+        register_distributed_operator(OP_TYPE, dist_op)
+        self.assertIs(get_distributed_operator(OP_TYPE), dist_op)
+
+        dist_impl0 = DistributedOperatorImpl()
+        register_distributed_operator_impl(OP_TYPE, dist_impl0)
+        self.assertIs(get_distributed_operator_impl(OP_TYPE, -1), dist_impl0)
+
+        dist_impl1 = DistributedOperatorImpl()
+        register_distributed_operator_impl(OP_TYPE, dist_impl1)
+        self.assertIs(get_distributed_operator_impl(OP_TYPE, -1), dist_impl1)
+        self.assertIs(get_distributed_operator_impl(OP_TYPE, 0), dist_impl0)
+
+        new_dist_op = DistributedOperator()
+        register_distributed_operator(OP_TYPE, new_dist_op)
+        self.assertIs(get_distributed_operator(OP_TYPE), new_dist_op)
+        new_dist_impl = DistributedOperatorImpl()
+        register_distributed_operator_impl(OP_TYPE, new_dist_impl)
+        self.assertIs(get_distributed_operator_impl(OP_TYPE, 0), new_dist_impl)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -35,6 +35,7 @@ from paddle.distributed.auto_parallel.context import DistributedContext
 from paddle.distributed.auto_parallel.context import set_default_distributed_context
 from paddle.distributed import fleet
 from paddle.distributed.auto_parallel.partitioner import Partitioner
+from paddle.distributed.auto_parallel.partitioner import _get_no_grad_set_name
 from paddle.distributed.auto_parallel.utils import _get_comm_group
 from paddle.distributed.auto_parallel.process import new_process_group
 
@@ -1172,5 +1173,45 @@ class TestDecoderLayerPartitioner(unittest.TestCase):
         self.assertTrue(dist_ops == ref_ops)
 
 
+class TestNoGradSetName(unittest.TestCase):
+    def test_mixed_members(self):
+        train_program = static.Program()
+        with static.program_guard(train_program):
+            x = static.data(name="x", shape=[4, 6], dtype='float32')
+        no_grad_set_name = _get_no_grad_set_name([x, "y"])
+        self.assertEqual(no_grad_set_name, set(["x", "y"]))
+        self.assertEqual(_get_no_grad_set_name(None), set())
+
+    def test_invalid_member(self):
+        with self.assertRaises(TypeError):
+            _get_no_grad_set_name(["x", 1])
+        with self.assertRaises(TypeError):
+            _get_no_grad_set_name("x")
+
+
+class TestSkipDistValidation(unittest.TestCase):
+    def test_skip_validation(self):
+        train_program = static.Program()
+        with static.program_guard(train_program):
+            x = static.data(name="x", shape=[4, 6], dtype='float32')
+            paddle.mean(x)
+        partitioner = Partitioner(fleet.DistributedStrategy(),
+                                  DistributedContext(), 0)
+
+        with unittest.mock.patch.dict(
+                "os.environ", {"PADDLE_SKIP_DIST_VALIDATION": "0"}):
+            self.assertFalse(
+                partitioner._is_valid_annotated_program(train_program))
+        for value in ["1", "true", "True"]:
+            with unittest.mock.patch.dict(
+                    "os.environ", {"PADDLE_SKIP_DIST_VALIDATION": value}):
+                self.assertTrue(
+                    partitioner._is_valid_annotated_program(train_program))
+        with unittest.mock.patch.dict(
+                "os.environ", {"PADDLE_SKIP_DIST_VALIDATION": ""}):
+            self.assertFalse(
+                partitioner._is_valid_annotated_program(train_program))
+
+
 if __name__ == "__main__":
     unittest.main()